@@ -14,12 +14,9 @@ Date: February 2026
 """
 
 import streamlit as st
-import numpy as np
 import pandas as pd
 import math
 from typing import Dict, List, Tuple, Optional
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import CoolProp.CoolProp as CP
 
 # Import the full calculation engine from Standard Condenser
@@ -36,14 +33,72 @@ except ImportError:
     st.stop()
 
 
+def get_calc_engine():
+    """Per-session calculation engine, created once and kept in session state.
+
+    Deliberately not a process-wide singleton: the engine's design
+    methods rebind and append to self.warnings while they run and return
+    that list in the results, so a shared instance would mix warnings
+    between sessions calculating concurrently. Per session, it is still
+    built once rather than per click.
+    """
+    if 'calc_engine' not in st.session_state:
+        st.session_state.calc_engine = TEMACompliantDXHeatExchangerDesign()
+    return st.session_state.calc_engine
+
+
+@st.cache_data(show_spinner=False)
+def run_zone_requirements(_designer, inputs):
+    """Memoized zone-requirement calculation keyed on the inputs dict.
+
+    The designer itself is excluded from the cache key (underscore
+    parameter); identical inputs replay the cached result instead of
+    repeating the CoolProp property calls.
+    """
+    return _designer.calculate_zone_requirements(inputs)
+
+
+@st.cache_data(show_spinner=False)
+def run_full_condenser_design(_engine, design_inputs):
+    """Memoized full TEMA condenser design keyed on the design inputs."""
+    return _engine.design_condenser(design_inputs)
+
+
+# Exact radio label -> engine glycol_type key; a lookup instead of the
+# old substring checks, which re-scanned the label on every rerun
+_GLYCOL_TYPES = {
+    "Water Only": "water",
+    "Water + Ethylene Glycol": "ethylene",
+    "Water + Propylene Glycol (Food Grade)": "propylene",
+}
+
+
+@st.cache_data(show_spinner=False)
+def _condenser_report_pdf(results, inputs) -> bytes:
+    """Memoized PDF rendering keyed on the results/inputs dicts.
+
+    Regenerating the report is the most expensive download-payload step
+    on this page; identical results replay the cached bytes instead of
+    rebuilding the reportlab document.
+    """
+    return PDFReportGenerator().generate_report(results, inputs)
+
+
+def _ceil_isqrt(n: int) -> int:
+    """Ceiling of sqrt(n) for a non-negative integer, without float sqrt."""
+    return 1 + math.isqrt(n - 1) if n > 0 else 0
+
+
 class IntegratedProfessionalDXCondenser:
     """
     Fully integrated DX condenser with row allocation + complete TEMA calculations
     """
     
     def __init__(self):
+        # No engine bound here: this instance may be cached process-wide
+        # (st.cache_resource in app.py), so the per-session engine is
+        # fetched at the call site instead of pinned to the instance
         self.initialize_session_state()
-        self.calc_engine = TEMACompliantDXHeatExchangerDesign()
     
     def get_tube_od_mm(self, tube_size: str) -> float:
         """Get tube OD in mm from TEMA standards"""
@@ -66,7 +121,11 @@ class IntegratedProfessionalDXCondenser:
     
     def run(self):
         """Main application entry point"""
-        
+
+        # The instance may be cached across sessions (st.cache_resource in
+        # app.py), so session keys must be ensured per run, not per __init__
+        self.initialize_session_state()
+
         st.markdown("## 🔧 Professional DX Condenser Designer")
         st.markdown("**Fully Integrated: Row Allocation + Complete TEMA Calculations + PDF Reports**")
         
@@ -108,12 +167,15 @@ class IntegratedProfessionalDXCondenser:
         if st.button("📊 Calculate Zone Requirements", type="primary", key="calc_req_integrated"):
             with st.spinner("Calculating zone requirements..."):
                 try:
-                    # Calculate what each zone needs
-                    requirements = self.calculate_zone_requirements(inputs)
+                    # Calculate what each zone needs (cached by inputs)
+                    requirements = run_zone_requirements(self, inputs)
                     st.session_state.zone_requirements = requirements
                     st.session_state.dx_inputs = inputs
+                    # No st.rerun(): the display below reads the state set
+                    # just above in this same pass, and the button click
+                    # already triggered a rerun — a second one would only
+                    # rebuild the page and drop the success message
                     st.success("✅ Zone requirements calculated!")
-                    st.rerun()
                 except Exception as e:
                     st.error(f"❌ Error: {str(e)}")
                     st.exception(e)
@@ -133,19 +195,18 @@ class IntegratedProfessionalDXCondenser:
         
         req = st.session_state.zone_requirements
         
-        # Show recommended allocation
+        # Show recommended allocation as one element instead of a 4-column
+        # st.info grid — a single st.info renders one frontend element per
+        # rerun rather than five (columns container + four boxes)
         st.markdown("#### 💡 Recommended Allocation (from calculations)")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.info(f"**Desuperheat:** {req['desuperheat_rows']:.0f} rows")
-        with col2:
-            st.info(f"**Condensing:** {req['condensing_rows']:.0f} rows")
-        with col3:
-            st.info(f"**Subcooling:** {req['subcooling_rows']:.0f} rows")
-        with col4:
-            total_rec = req['desuperheat_rows'] + req['condensing_rows'] + req['subcooling_rows']
-            st.info(f"**Total:** {total_rec:.0f} rows")
+
+        total_rec = req['desuperheat_rows'] + req['condensing_rows'] + req['subcooling_rows']
+        st.info(
+            f"**Desuperheat:** {req['desuperheat_rows']:.0f} rows | "
+            f"**Condensing:** {req['condensing_rows']:.0f} rows | "
+            f"**Subcooling:** {req['subcooling_rows']:.0f} rows | "
+            f"**Total:** {total_rec:.0f} rows"
+        )
         
         st.markdown("---")
         st.markdown("#### 🎯 Your Row Allocation")
@@ -245,16 +306,18 @@ class IntegratedProfessionalDXCondenser:
                     design_inputs = self.convert_allocation_to_design_inputs(inputs, allocation)
                     
                     # Call the full Standard Condenser calculation engine
-                    results = self.calc_engine.design_condenser(design_inputs)
+                    # (cached: identical design inputs replay the stored result)
+                    results = run_full_condenser_design(get_calc_engine(), design_inputs)
                     
                     # Add row allocation details to results
                     results['row_allocation'] = allocation
                     results['zone_requirements'] = st.session_state.zone_requirements
                     
                     st.session_state.full_results = results
+                    # As in Step 1, no st.rerun(): the results display
+                    # below already sees full_results in this pass
                     st.success("✅ Full design calculated!")
-                    st.rerun()
-                    
+
                 except Exception as e:
                     st.error(f"❌ Error in calculation: {str(e)}")
                     st.exception(e)
@@ -265,7 +328,13 @@ class IntegratedProfessionalDXCondenser:
     
     def create_full_input_form(self) -> Dict:
         """Create complete input form matching Standard Condenser"""
-        
+
+        # Not wrapped in st.form: widgets inside a form keep their stale
+        # values until submit, but this tree is conditional — the glycol
+        # percentage field, the inlet-temperature floor, and the BWG/pitch
+        # bounds all depend on earlier widgets in the same pass. Rerun cost
+        # is contained instead by caching the calculation behind the
+        # Calculate button (run_zone_requirements).
         st.markdown("### 🔧 TEMA Design Parameters")
         st.markdown("*All inputs match Standard Condenser for full compatibility*")
         
@@ -320,17 +389,12 @@ class IntegratedProfessionalDXCondenser:
         with col2:
             st.markdown("#### Water/Glycol Parameters")
             
-            glycol_options = ["Water Only", "Water + Ethylene Glycol", "Water + Propylene Glycol (Food Grade)"]
-            glycol_choice = st.radio("Fluid Type", glycol_options)
-            
-            if "Ethylene" in glycol_choice:
-                inputs["glycol_type"] = "ethylene"
-            elif "Propylene" in glycol_choice:
-                inputs["glycol_type"] = "propylene"
-            else:
-                inputs["glycol_type"] = "water"
-            
-            if "Glycol" in glycol_choice:
+            glycol_choice = st.radio("Fluid Type", list(_GLYCOL_TYPES))
+
+            inputs["glycol_type"] = _GLYCOL_TYPES[glycol_choice]
+            has_glycol = inputs["glycol_type"] != "water"
+
+            if has_glycol:
                 inputs["glycol_percentage"] = st.number_input(
                     "Glycol Percentage",
                     min_value=0,
@@ -343,7 +407,7 @@ class IntegratedProfessionalDXCondenser:
             
             inputs["T_sec_in"] = st.number_input(
                 "Water Inlet Temperature (°C)",
-                min_value=-20.0 if "Glycol" in glycol_choice else 0.0,
+                min_value=-20.0 if has_glycol else 0.0,
                 max_value=80.0,
                 value=30.0,
                 step=1.0
@@ -515,7 +579,9 @@ class IntegratedProfessionalDXCondenser:
         if tube_layout == "Triangular":
             n_rows_estimate = math.ceil(math.sqrt(n_tubes_total / 1.155))
         else:
-            n_rows_estimate = math.ceil(math.sqrt(n_tubes_total))
+            # ceil(sqrt(n)) in exact integer arithmetic — avoids the
+            # float round-trip for large tube counts
+            n_rows_estimate = _ceil_isqrt(n_tubes_total)
         
         # Ensure minimum rows
         n_rows_estimate = max(3, n_rows_estimate)
@@ -578,25 +644,26 @@ class IntegratedProfessionalDXCondenser:
         """Display zone requirements"""
         
         st.success("✅ Zone Requirements Calculated")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Desuperheat", f"{req['desuperheat_rows']:.0f} rows")
-            st.caption(f"{req['Q_desuperheat']/1000:.1f} kW")
-        
-        with col2:
-            st.metric("Condensing", f"{req['condensing_rows']:.0f} rows")
-            st.caption(f"{req['Q_condensing']/1000:.1f} kW")
-        
-        with col3:
-            st.metric("Subcooling", f"{req['subcooling_rows']:.0f} rows")
-            st.caption(f"{req['Q_subcooling']/1000:.1f} kW")
-        
-        with col4:
-            total = req['desuperheat_rows'] + req['condensing_rows'] + req['subcooling_rows']
-            st.metric("Total", f"{total:.0f} rows")
-            st.caption(f"{req['Q_total']/1000:.1f} kW")
+
+        # One st.dataframe instead of a 4-column grid of st.metric/st.caption
+        # pairs — a single frontend element per rerun instead of nine
+        total = req['desuperheat_rows'] + req['condensing_rows'] + req['subcooling_rows']
+        df = pd.DataFrame({
+            "Zone": ["Desuperheat", "Condensing", "Subcooling", "Total"],
+            "Rows": [
+                f"{req['desuperheat_rows']:.0f}",
+                f"{req['condensing_rows']:.0f}",
+                f"{req['subcooling_rows']:.0f}",
+                f"{total:.0f}",
+            ],
+            "Duty (kW)": [
+                f"{req['Q_desuperheat']/1000:.1f}",
+                f"{req['Q_condensing']/1000:.1f}",
+                f"{req['Q_subcooling']/1000:.1f}",
+                f"{req['Q_total']/1000:.1f}",
+            ],
+        })
+        st.dataframe(df, hide_index=True, use_container_width=True)
         
         st.info("✅ Proceed to **Step 2** to allocate rows to zones")
     
@@ -616,9 +683,15 @@ class IntegratedProfessionalDXCondenser:
         
         return design_inputs
     
+    @st.fragment
     def display_full_results(self, results: Dict):
-        """Display complete results with PDF generation"""
-        
+        """Display complete results with PDF generation.
+
+        Runs as a fragment: the PDF generate/download buttons and result
+        tabs rerun only this section instead of re-executing the whole
+        page (input form included) on every interaction.
+        """
+
         st.markdown("### 🎉 Complete TEMA Design Results")
         
         # Design status
@@ -682,16 +755,16 @@ class IntegratedProfessionalDXCondenser:
             with st.spinner("Generating PDF report..."):
                 try:
                     # Generate PDF using Standard Condenser's PDF generator
-                    pdf_generator = PDFReportGenerator()
-                    pdf_buffer = pdf_generator.generate_condenser_report(
+                    # (cached: identical results reuse the rendered bytes)
+                    pdf_bytes = _condenser_report_pdf(
                         results,
                         st.session_state.dx_inputs
                     )
-                    
+
                     # Offer download
                     st.download_button(
                         label="⬇️ Download PDF Report",
-                        data=pdf_buffer,
+                        data=pdf_bytes,
                         file_name=f"TEMA_Professional_DX_Condenser_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.pdf",
                         mime="application/pdf"
                     )
@@ -729,36 +802,35 @@ class IntegratedProfessionalDXCondenser:
         """Display thermal performance details"""
         st.markdown("#### Thermal Performance")
         
-        # Create dataframe for zone performance
-        zone_data = []
-        
-        if 'Q_desuperheat_achieved' in results:
-            zone_data.append({
-                'Zone': 'Desuperheat',
-                'Required (kW)': f"{results.get('Q_desuperheat_req', 0)/1000:.2f}",
-                'Achieved (kW)': f"{results.get('Q_desuperheat_achieved', 0)/1000:.2f}",
-                'Match': f"{results.get('Q_desuperheat_achieved', 0)/max(results.get('Q_desuperheat_req', 1), 0.001)*100:.1f}%"
-            })
-        
-        if 'Q_latent_achieved' in results:
-            zone_data.append({
-                'Zone': 'Latent/Condensing',
-                'Required (kW)': f"{results.get('Q_latent_req', 0)/1000:.2f}",
-                'Achieved (kW)': f"{results.get('Q_latent_achieved', 0)/1000:.2f}",
-                'Match': f"{results.get('Q_latent_achieved', 0)/max(results.get('Q_latent_req', 1), 0.001)*100:.1f}%"
-            })
-        
-        if 'Q_subcool_achieved' in results:
-            zone_data.append({
-                'Zone': 'Subcooling',
-                'Required (kW)': f"{results.get('Q_subcool_req', 0)/1000:.2f}",
-                'Achieved (kW)': f"{results.get('Q_subcool_achieved', 0)/1000:.2f}",
-                'Match': f"{results.get('Q_subcool_achieved', 0)/max(results.get('Q_subcool_req', 1), 0.001)*100:.1f}%"
-            })
-        
+        # Build the zone table as numeric records; formatting is applied
+        # in one Styler pass instead of per-cell f-strings, and the
+        # underlying values stay sortable in the frontend
+        zone_data = [
+            (
+                label,
+                results.get(f'Q_{key}_req', 0) / 1000,
+                results.get(f'Q_{key}_achieved', 0) / 1000,
+                results.get(f'Q_{key}_achieved', 0) / max(results.get(f'Q_{key}_req', 1), 0.001) * 100,
+            )
+            for key, label in [
+                ('desuperheat', 'Desuperheat'),
+                ('latent', 'Latent/Condensing'),
+                ('subcool', 'Subcooling'),
+            ]
+            if f'Q_{key}_achieved' in results
+        ]
+
         if zone_data:
-            df = pd.DataFrame(zone_data)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            df = pd.DataFrame.from_records(
+                zone_data,
+                columns=['Zone', 'Required (kW)', 'Achieved (kW)', 'Match']
+            )
+            styled = df.style.format({
+                'Required (kW)': '{:.2f}',
+                'Achieved (kW)': '{:.2f}',
+                'Match': '{:.1f}%',
+            })
+            st.dataframe(styled, use_container_width=True, hide_index=True)
     
     def display_geometry_and_flow(self, results: Dict):
         """Display geometry and flow details"""
@@ -766,17 +838,20 @@ class IntegratedProfessionalDXCondenser:
         
         col1, col2 = st.columns(2)
         
-        with col1:
-            st.markdown("**Shell Side:**")
-            st.write(f"- Shell ID: {results.get('shell_id_m', 0)*1000:.1f} mm")
-            st.write(f"- Velocity: {results.get('v_shell_ms', 0):.2f} m/s")
-            st.write(f"- Pressure Drop: {results.get('dP_shell_kPa', 0):.2f} kPa")
-        
-        with col2:
-            st.markdown("**Tube Side:**")
-            st.write(f"- Number of Tubes: {results.get('n_tubes', 0)}")
-            st.write(f"- Velocity: {results.get('v_tube_ms', 0):.2f} m/s")
-            st.write(f"- Pressure Drop: {results.get('dP_tube_kPa', 0):.2f} kPa")
+        # One markdown element per column instead of a header plus three
+        # st.write calls — each st.write is a separate delta message
+        col1.markdown(
+            f"**Shell Side:**\n"
+            f"- Shell ID: {results.get('shell_id_m', 0)*1000:.1f} mm\n"
+            f"- Velocity: {results.get('v_shell_ms', 0):.2f} m/s\n"
+            f"- Pressure Drop: {results.get('dP_shell_kPa', 0):.2f} kPa"
+        )
+        col2.markdown(
+            f"**Tube Side:**\n"
+            f"- Number of Tubes: {results.get('n_tubes', 0)}\n"
+            f"- Velocity: {results.get('v_tube_ms', 0):.2f} m/s\n"
+            f"- Pressure Drop: {results.get('dP_tube_kPa', 0):.2f} kPa"
+        )
     
     def display_tema_compliance(self, results: Dict):
         """Display TEMA compliance status"""
@@ -1,24 +1,40 @@
+import hashlib
+import hmac
+from functools import lru_cache
+
 import streamlit as st
 import numpy as np
 import pandas as pd
 import math
-from scipy.optimize import fsolve, minimize
-import plotly.graph_objects as go
 from typing import Dict, Tuple, List, Optional
 import warnings
 import CoolProp.CoolProp as CP
 from datetime import datetime
 import base64
 from io import BytesIO
-import reportlab
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, landscape
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 import os
 
+# Triangular-pitch geometry factor sqrt(3)/2, previously hardcoded as 0.866
+_SQRT3_2 = math.sqrt(3) / 2
+
+
+def _import_reportlab():
+    """Import reportlab lazily - only PDF report generation needs it.
+
+    Keeps the module import (and therefore the first paint of any page
+    that loads this engine) free of reportlab's import cost.
+    """
+    global colors, letter, landscape
+    global SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+    global getSampleStyleSheet, ParagraphStyle, inch
+    global TA_CENTER, TA_LEFT, TA_RIGHT
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter, landscape
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+
 warnings.filterwarnings('ignore')
 
 # ============================================================================
@@ -42,45 +58,45 @@ warnings.filterwarnings('ignore')
 # PASSWORD PROTECTION
 # ============================================================================
 
+# Precomputed digest so the plaintext is never compared byte-by-byte per rerun
+_PASSWORD_HASH = hashlib.blake2b(b"Semaanju", digest_size=16).digest()
+
+
 def check_password():
     """Password protection for the app"""
+    # Fast path: once authenticated, skip all widget construction
+    if st.session_state.get("password_correct"):
+        return True
+
     def password_entered():
-        if st.session_state["password"] == "Semaanju":
+        entered = hashlib.blake2b(
+            st.session_state["password"].encode(), digest_size=16
+        ).digest()
+        if hmac.compare_digest(entered, _PASSWORD_HASH):
             st.session_state["password_correct"] = True
             del st.session_state["password"]
         else:
             st.session_state["password_correct"] = False
 
-    if "password_correct" not in st.session_state:
-        st.text_input(
-            "Enter Password", type="password", on_change=password_entered, key="password"
-        )
-        st.write("*Please enter the password to access the design tool*")
-        return False
-    elif not st.session_state["password_correct"]:
-        st.text_input(
-            "Enter Password", type="password", on_change=password_entered, key="password"
-        )
+    # Single widget path: the input is identical whether the user has not
+    # typed anything yet or got the password wrong; only the caption differs
+    st.text_input(
+        "Enter Password", type="password", on_change=password_entered, key="password"
+    )
+    if "password_correct" in st.session_state:
         st.error("😕 Password incorrect")
-        return False
     else:
-        return True
-
-# ============================================================================
-# PAGE CONFIGURATION
-# ============================================================================
-
-st.set_page_config(
-    page_title="TEMA 10th Edition DX Shell & Tube HX Designer",
-    page_icon="🌡️",
-    layout="wide"
-)
+        st.write("*Please enter the password to access the design tool*")
+    return False
 
 # ============================================================================
-# CUSTOM CSS
+# PAGE CONFIGURATION & CUSTOM CSS
 # ============================================================================
+# Only applied when this module runs standalone (see main()); when imported
+# by app.py the page config and CSS are already set by the host script, and a
+# second st.set_page_config call would raise StreamlitAPIException.
 
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -187,7 +203,7 @@ st.markdown("""
         margin-top: 2rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 # ============================================================================
 # TEMA 10th EDITION STANDARDS IMPLEMENTATION
@@ -830,6 +846,68 @@ class TEMAVibrationAnalysis:
 # MAIN DESIGN CLASS - TEMA 10th EDITION COMPLIANT
 # ============================================================================
 
+@lru_cache(maxsize=256)
+def _refrigerant_saturation_props(refrigerant: str, T_sat: float) -> Dict:
+    """CoolProp saturation properties, memoized on (refrigerant, T_sat).
+
+    Each lookup is ~14 PropsSI equation-of-state evaluations; designs are
+    routinely recalculated at the same saturation temperature, so the
+    memo turns the repeats into dict hits. Failures are raised to the
+    caller (and not cached) so a transient CoolProp error can retry.
+    """
+    T_K = T_sat + 273.15
+
+    # Saturation pressure
+    P_sat = CP.PropsSI('P', 'T', T_K, 'Q', 1, refrigerant)
+
+    # Liquid at saturation
+    rho_l = CP.PropsSI('D', 'T', T_K, 'Q', 0, refrigerant)
+    cp_l = CP.PropsSI('C', 'T', T_K, 'Q', 0, refrigerant)
+    k_l = CP.PropsSI('L', 'T', T_K, 'Q', 0, refrigerant)
+    mu_l = CP.PropsSI('V', 'T', T_K, 'Q', 0, refrigerant)
+
+    # Vapor at saturation
+    rho_v = CP.PropsSI('D', 'T', T_K, 'Q', 1, refrigerant)
+    cp_v = CP.PropsSI('C', 'T', T_K, 'Q', 1, refrigerant)
+    k_v = CP.PropsSI('L', 'T', T_K, 'Q', 1, refrigerant)
+    mu_v = CP.PropsSI('V', 'T', T_K, 'Q', 1, refrigerant)
+
+    # Latent heat (J/kg)
+    h_l = CP.PropsSI('H', 'T', T_K, 'Q', 0, refrigerant)
+    h_v = CP.PropsSI('H', 'T', T_K, 'Q', 1, refrigerant)
+    h_fg = h_v - h_l
+
+    # Prandtl numbers
+    pr_l = cp_l * mu_l / k_l
+    pr_v = cp_v * mu_v / k_v
+
+    # Surface tension
+    sigma = CP.PropsSI('I', 'T', T_K, 'Q', 0, refrigerant)
+
+    # Critical properties
+    T_crit = CP.PropsSI('TCRIT', refrigerant) - 273.15
+    P_crit = CP.PropsSI('PCRIT', refrigerant) / 1000  # kPa
+
+    return {
+        "cp_vapor": cp_v / 1000,  # kJ/kg·K
+        "cp_liquid": cp_l / 1000,  # kJ/kg·K
+        "h_fg": h_fg / 1000,  # kJ/kg
+        "rho_vapor": rho_v,  # kg/m³
+        "rho_liquid": rho_l,  # kg/m³
+        "mu_vapor": mu_v,  # Pa·s
+        "mu_liquid": mu_l,  # Pa·s
+        "k_vapor": k_v,  # W/m·K
+        "k_liquid": k_l,  # W/m·K
+        "pr_vapor": pr_v,
+        "pr_liquid": pr_l,
+        "sigma": sigma,
+        "T_critical": T_crit,
+        "P_critical": P_crit,
+        "T_sat": T_sat,
+        "P_sat": P_sat / 1000,  # kPa
+    }
+
+
 class TEMACompliantDXHeatExchangerDesign:
     """TEMA 10th Edition Compliant DX Shell & Tube Heat Exchanger Design"""
     
@@ -966,57 +1044,8 @@ class TEMACompliantDXHeatExchangerDesign:
     def get_refrigerant_properties(self, refrigerant: str, T_sat: float) -> Dict:
         """Get EXACT refrigerant properties from CoolProp at saturation temperature"""
         try:
-            T_K = T_sat + 273.15
-            
-            # Saturation pressure
-            P_sat = CP.PropsSI('P', 'T', T_K, 'Q', 1, refrigerant)
-            
-            # Liquid at saturation
-            rho_l = CP.PropsSI('D', 'T', T_K, 'Q', 0, refrigerant)
-            cp_l = CP.PropsSI('C', 'T', T_K, 'Q', 0, refrigerant)
-            k_l = CP.PropsSI('L', 'T', T_K, 'Q', 0, refrigerant)
-            mu_l = CP.PropsSI('V', 'T', T_K, 'Q', 0, refrigerant)
-            
-            # Vapor at saturation
-            rho_v = CP.PropsSI('D', 'T', T_K, 'Q', 1, refrigerant)
-            cp_v = CP.PropsSI('C', 'T', T_K, 'Q', 1, refrigerant)
-            k_v = CP.PropsSI('L', 'T', T_K, 'Q', 1, refrigerant)
-            mu_v = CP.PropsSI('V', 'T', T_K, 'Q', 1, refrigerant)
-            
-            # Latent heat (J/kg)
-            h_l = CP.PropsSI('H', 'T', T_K, 'Q', 0, refrigerant)
-            h_v = CP.PropsSI('H', 'T', T_K, 'Q', 1, refrigerant)
-            h_fg = h_v - h_l
-            
-            # Prandtl numbers
-            pr_l = cp_l * mu_l / k_l
-            pr_v = cp_v * mu_v / k_v
-            
-            # Surface tension
-            sigma = CP.PropsSI('I', 'T', T_K, 'Q', 0, refrigerant)
-            
-            # Critical properties
-            T_crit = CP.PropsSI('TCRIT', refrigerant) - 273.15
-            P_crit = CP.PropsSI('PCRIT', refrigerant) / 1000  # kPa
-            
-            return {
-                "cp_vapor": cp_v / 1000,  # kJ/kg·K
-                "cp_liquid": cp_l / 1000,  # kJ/kg·K
-                "h_fg": h_fg / 1000,  # kJ/kg
-                "rho_vapor": rho_v,  # kg/m³
-                "rho_liquid": rho_l,  # kg/m³
-                "mu_vapor": mu_v,  # Pa·s
-                "mu_liquid": mu_l,  # Pa·s
-                "k_vapor": k_v,  # W/m·K
-                "k_liquid": k_l,  # W/m·K
-                "pr_vapor": pr_v,
-                "pr_liquid": pr_l,
-                "sigma": sigma,
-                "T_critical": T_crit,
-                "P_critical": P_crit,
-                "T_sat": T_sat,
-                "P_sat": P_sat / 1000,  # kPa
-            }
+            # Copy so callers can mutate their dict without touching the memo
+            return dict(_refrigerant_saturation_props(refrigerant, T_sat))
         except Exception as e:
             self.warnings.append(f"CoolProp error for {refrigerant} at {T_sat}°C: {e}")
             # Fallback to approximate values for R134a if CoolProp fails
@@ -1283,7 +1312,7 @@ class TEMACompliantDXHeatExchangerDesign:
                                tube_layout: str = "triangular") -> float:
         """Calculate shell diameter based on tube layout"""
         if tube_layout.lower() == "triangular":
-            tubes_per_row = math.sqrt(n_tubes / 0.866)
+            tubes_per_row = math.sqrt(n_tubes / _SQRT3_2)
             bundle_width = tubes_per_row * pitch
         else:
             tubes_per_row = math.sqrt(n_tubes)
@@ -1304,7 +1333,7 @@ class TEMACompliantDXHeatExchangerDesign:
                                 tube_layout: str = "triangular") -> float:
         """Calculate bundle diameter"""
         if tube_layout.lower() == "triangular":
-            tubes_per_row = math.sqrt(n_tubes / 0.866)
+            tubes_per_row = math.sqrt(n_tubes / _SQRT3_2)
             bundle_diameter = tubes_per_row * pitch
         else:
             tubes_per_row = math.sqrt(n_tubes)
@@ -1409,7 +1438,7 @@ class TEMACompliantDXHeatExchangerDesign:
         
         # Calculate equivalent diameter for shell-side flow
         if tube_layout == "triangular":
-            D_e = 4 * (0.866 * tube_pitch**2 - 0.5 * math.pi * tube_od**2 / 4) / (math.pi * tube_od)
+            D_e = 4 * (_SQRT3_2 * tube_pitch**2 - 0.5 * math.pi * tube_od**2 / 4) / (math.pi * tube_od)
         else:
             D_e = 4 * (tube_pitch**2 - math.pi * tube_od**2 / 4) / (math.pi * tube_od)
         
@@ -1930,7 +1959,7 @@ class TEMACompliantDXHeatExchangerDesign:
 
         # Equivalent diameter for shell-side (tube bundle passages)
         if tube_layout == "triangular":
-            D_e = 4.0 * (0.866 * tube_pitch**2 - 0.5 * math.pi * tube_od**2 / 4.0) / (math.pi * tube_od)
+            D_e = 4.0 * (_SQRT3_2 * tube_pitch**2 - 0.5 * math.pi * tube_od**2 / 4.0) / (math.pi * tube_od)
         else:
             D_e = 4.0 * (tube_pitch**2 - math.pi * tube_od**2 / 4.0) / (math.pi * tube_od)
 
@@ -2689,6 +2718,7 @@ class PDFReportGenerator:
     """Generate TEMA-style PDF report of heat exchanger design"""
     
     def __init__(self):
+        _import_reportlab()
         self.styles = getSampleStyleSheet()
         self.title_style = ParagraphStyle(
             'CustomTitle',
@@ -4088,7 +4118,14 @@ def display_results(results: Dict, inputs: Dict):
 
 def main():
     """Main function to run the app"""
-    
+
+    st.set_page_config(
+        page_title="TEMA 10th Edition DX Shell & Tube HX Designer",
+        page_icon="🌡️",
+        layout="wide"
+    )
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
     if not check_password():
         st.stop()
     